@@ -2,13 +2,21 @@
 """
 Add profile feature files to Xcode project.pbxproj
 """
-import re
-import uuid
 import os
-
-def generate_xcode_id():
-    """Generate a 24-character hex ID like Xcode uses"""
-    return ''.join([f'{uuid.uuid4().hex[i:i+2].upper()}' for i in range(0, 24, 2)])
+import sys
+
+from pbxproj_io import is_processed, mark_processed, write_project
+from pbxproj_parser import load_project
+from pbxproj_regex import MAIN_SOURCES_PHASE_ID, TEST_SOURCES_PHASE_ID
+from pbxproj_tool import (
+    add_to_list,
+    all_referenced,
+    build_file_line,
+    drop_referenced,
+    file_ref_line,
+    find_groups,
+    generate_xcode_id,
+)
 
 # Files to add with their generated IDs
 # Format: 'path/to/file.swift': (file_ref_id, build_file_id)
@@ -45,133 +53,93 @@ test_files_to_add = {
     'NaarsCarsTests/Features/Profile/PublicProfileViewModelTests.swift': (generate_xcode_id(), generate_xcode_id()),
 }
 
-project_file = 'NaarsCars.xcodeproj/project.pbxproj'
+def main():
+    project_file = 'NaarsCars.xcodeproj/project.pbxproj'
 
-if not os.path.exists(project_file):
-    print(f"❌ Error: {project_file} not found")
-    print("Please run this script from the NaarsCars directory")
-    exit(1)
+    if not os.path.exists(project_file):
+        print(f"❌ Error: {project_file} not found")
+        print("Please run this script from the NaarsCars directory")
+        sys.exit(1)
 
-with open(project_file, 'r') as f:
-    content = f.read()
+    # A repeat run on the project this script last wrote would add the files again
+    if is_processed(project_file, 'profile'):
+        print("✅ Project unchanged since profile files were added; nothing to do")
+        return
+
+    # Nothing to add if the project already references every file
+    if all_referenced(project_file, {**files_to_add, **test_files_to_add}):
+        print("✅ Profile files already in Xcode project; nothing to do")
+        return
+
+    project = load_project(project_file)
+    drop_referenced(project, files_to_add)
+    drop_referenced(project, test_files_to_add)
 
-# Add file references
-file_refs_section = re.search(r'(/\* Begin PBXFileReference section \*/.*?)(/\* End PBXFileReference section \*/)', content, re.DOTALL)
-if file_refs_section:
-    file_refs = file_refs_section.group(1)
-    
     # Add source file references
     for filepath, (file_id, build_id) in files_to_add.items():
         filename = filepath.split('/')[-1]
-        file_ref = f'\t\t{file_id} /* {filename} */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = {filename}; sourceTree = "<group>"; }};\n'
-        if file_id not in file_refs:
-            file_refs += file_ref
-            print(f"✅ Added file reference: {filepath}")
-        else:
-            print(f"⚠️  File reference already exists: {filepath}")
-    
+        project.add_object('PBXFileReference', file_id, file_ref_line(file_id, filename))
+        print(f"✅ Added file reference: {filepath}")
+
     # Add test file references
     for filepath, (file_id, build_id) in test_files_to_add.items():
         filename = filepath.split('/')[-1]
-        file_ref = f'\t\t{file_id} /* {filename} */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = {filename}; sourceTree = "<group>"; }};\n'
-        if file_id not in file_refs:
-            file_refs += file_ref
-            print(f"✅ Added test file reference: {filepath}")
-        else:
-            print(f"⚠️  Test file reference already exists: {filepath}")
-    
-    content = content.replace(file_refs_section.group(1), file_refs)
+        project.add_object('PBXFileReference', file_id, file_ref_line(file_id, filename))
+        print(f"✅ Added test file reference: {filepath}")
 
-# Add build files
-build_files_section = re.search(r'(/\* Begin PBXBuildFile section \*/.*?)(/\* End PBXBuildFile section \*/)', content, re.DOTALL)
-if build_files_section:
-    build_files = build_files_section.group(1)
-    
     # Add source build files
     for filepath, (file_id, build_id) in files_to_add.items():
         filename = filepath.split('/')[-1]
-        build_file = f'\t\t{build_id} /* {filename} in Sources */ = {{isa = PBXBuildFile; fileRef = {file_id} /* {filename} */; }};\n'
-        if build_id not in build_files:
-            build_files += build_file
-            print(f"✅ Added build file: {filepath}")
-        else:
-            print(f"⚠️  Build file already exists: {filepath}")
-    
+        project.add_object('PBXBuildFile', build_id, build_file_line(build_id, file_id, filename))
+        print(f"✅ Added build file: {filepath}")
+
     # Add test build files
     for filepath, (file_id, build_id) in test_files_to_add.items():
         filename = filepath.split('/')[-1]
-        build_file = f'\t\t{build_id} /* {filename} in Sources */ = {{isa = PBXBuildFile; fileRef = {file_id} /* {filename} */; }};\n'
-        if build_id not in build_files:
-            build_files += build_file
-            print(f"✅ Added test build file: {filepath}")
-        else:
-            print(f"⚠️  Test build file already exists: {filepath}")
-    
-    content = content.replace(build_files_section.group(1), build_files)
-
-# Add to appropriate groups
-# This is a simplified version - you may need to adjust group IDs based on your project structure
-
-# Add ProfileService to Services group
-services_group_pattern = r'(/\* Services \*/.*?children = \(.*?)(\);.*?path = Services;)'
-match = re.search(services_group_pattern, content, re.DOTALL)
-if match:
-    children = match.group(1)
-    file_id = files_to_add['Core/Services/ProfileService.swift'][0]
-    filename = 'ProfileService.swift'
-    child = f'\t\t\t\t{file_id} /* {filename} */,\n'
-    if file_id not in children:
-        children += child
-        content = content.replace(match.group(1), children)
-        print(f"✅ Added ProfileService to Services group")
-
-# Add Validators to Utilities group
-utilities_group_pattern = r'(/\* Utilities \*/.*?children = \(.*?)(\);.*?path = Utilities;)'
-match = re.search(utilities_group_pattern, content, re.DOTALL)
-if match:
-    children = match.group(1)
-    file_id = files_to_add['Core/Utilities/Validators.swift'][0]
-    filename = 'Validators.swift'
-    child = f'\t\t\t\t{file_id} /* {filename} */,\n'
-    if file_id not in children:
-        children += child
-        content = content.replace(match.group(1), children)
-        print(f"✅ Added Validators to Utilities group")
-
-# Add ViewModels to Profile group (create if needed)
-# Add Views to Profile group (create if needed)
-# Add UI Components to appropriate groups
-
-# Add to Sources build phase
-sources_phase_pattern = r'(ACDCBDC42F0B74F400956D1C /\* Sources \*/ = \{.*?files = \(.*?)(\);.*?runOnlyForDeploymentPostprocessing = 0;)'
-match = re.search(sources_phase_pattern, content, re.DOTALL)
-if match:
-    files = match.group(1)
+        project.add_object('PBXBuildFile', build_id, build_file_line(build_id, file_id, filename))
+        print(f"✅ Added test build file: {filepath}")
+
+    # Add to appropriate groups
+    # This is a simplified version - you may need to adjust group IDs based on your project structure
+
+    groups = find_groups(project, ('Services', 'Utilities'))
+
+    # Add ProfileService to Services group
+    services_group_id = groups.get('Services')
+    ids = files_to_add.get('Core/Services/ProfileService.swift')
+    if services_group_id and ids and add_to_list(project, services_group_id, 'children', ids[0], 'ProfileService.swift'):
+        print("✅ Added ProfileService to Services group")
+
+    # Add Validators to Utilities group
+    utilities_group_id = groups.get('Utilities')
+    ids = files_to_add.get('Core/Utilities/Validators.swift')
+    if utilities_group_id and ids and add_to_list(project, utilities_group_id, 'children', ids[0], 'Validators.swift'):
+        print("✅ Added Validators to Utilities group")
+
+    # Add ViewModels to Profile group (create if needed)
+    # Add Views to Profile group (create if needed)
+    # Add UI Components to appropriate groups
+
+    # Add to Sources build phase
     for filepath, (file_id, build_id) in files_to_add.items():
         filename = filepath.split('/')[-1]
-        file_entry = f'\t\t\t\t{build_id} /* {filename} in Sources */,\n'
-        if build_id not in files:
-            files += file_entry
+        if add_to_list(project, MAIN_SOURCES_PHASE_ID, 'files', build_id, f'{filename} in Sources'):
             print(f"✅ Added {filepath} to Sources build phase")
-    content = content.replace(match.group(1), files)
 
-# Add to test Sources build phase
-test_sources_phase_pattern = r'(ACDCBDD12F0B74F700956D1C /\* Sources \*/ = \{.*?files = \(.*?)(\);.*?runOnlyForDeploymentPostprocessing = 0;)'
-match = re.search(test_sources_phase_pattern, content, re.DOTALL)
-if match:
-    files = match.group(1)
+    # Add to test Sources build phase
     for filepath, (file_id, build_id) in test_files_to_add.items():
         filename = filepath.split('/')[-1]
-        file_entry = f'\t\t\t\t{build_id} /* {filename} in Sources */,\n'
-        if build_id not in files:
-            files += file_entry
+        if add_to_list(project, TEST_SOURCES_PHASE_ID, 'files', build_id, f'{filename} in Sources'):
             print(f"✅ Added {filepath} to test Sources build phase")
-    content = content.replace(match.group(1), files)
 
-with open(project_file, 'w') as f:
-    f.write(content)
+    content = project.serialize()
+    if content != project.content:
+        write_project(project_file, content)
+    mark_processed(project_file, 'profile')
 
-print("\n✅ All profile files added to Xcode project")
-print("⚠️  Note: You may need to manually add files to group folders in Xcode Project Navigator")
-print("⚠️  Note: Verify all files appear in Project Navigator and build the project")
+    print("\n✅ All profile files added to Xcode project")
+    print("⚠️  Note: You may need to manually add files to group folders in Xcode Project Navigator")
+    print("⚠️  Note: Verify all files appear in Project Navigator and build the project")
 
+if __name__ == "__main__":
+    main()
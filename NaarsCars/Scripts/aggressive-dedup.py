@@ -3,66 +3,73 @@
 
 import re
 import os
+from itertools import chain
+
+from pbxproj_io import is_processed, mark_processed, read_project, write_project
+from pbxproj_parser import edit_pieces, find_sections
 
 PROJECT_FILE = "NaarsCars.xcodeproj/project.pbxproj"
 
+# One line mentioning "UUID /* filename.swift in Sources */": either a PBXBuildFile
+# declaration (decl set) or an entry in a Sources build phase files list
+SOURCES_LINE = re.compile(
+    r'^[^\n]*?(?P<uuid>[A-F0-9]{24}) /\* (?P<filename>[^\n]+?\.swift) in Sources \*/'
+    r'(?P<decl> = \{isa = PBXBuildFile; fileRef = [A-F0-9]{24}[^}\n]+\};)?'
+    r'[^\n]*\n?',
+    re.MULTILINE)
+
+# Build file declarations, then the build phases whose files lists refer to them
+SCANNED_SECTIONS = ('PBXBuildFile', 'PBXSourcesBuildPhase')
+
 def get_filename(path):
     """Extract just the filename from a path"""
     return os.path.basename(path)
 
 def main():
-    with open(PROJECT_FILE, 'r') as f:
-        content = f.read()
+    if is_processed(PROJECT_FILE, 'aggressive-dedup'):
+        print("No duplicate build files found (project unchanged since last run)")
+        return
     
-    # Find all PBXBuildFile entries for Swift sources
-    # Format: UUID /* filename.swift in Sources */ = {isa = PBXBuildFile; fileRef = UUID /* filename.swift */; };
-    build_file_pattern = r'([A-F0-9]{24}) /\* (.+?\.swift) in Sources \*/ = \{isa = PBXBuildFile; fileRef = ([A-F0-9]{24})[^}]+\};'
+    content = read_project(PROJECT_FILE)
     
-    # Group build files by their base filename
-    build_files_by_name = {}
-    for match in re.finditer(build_file_pattern, content):
-        uuid = match.group(1)
-        filename = get_filename(match.group(2))
-        build_files_by_name.setdefault(filename, []).append(uuid)
+    # One pass in file order over the only two sections such lines live in, found
+    # with a single str.find sweep. PBXBuildFile declarations come before the build
+    # phases, so a declaration for an already-seen filename marks its UUID as a
+    # duplicate before any files list refers to it.
+    sections = find_sections(content)
+    spans = [sections[name] for name in SCANNED_SECTIONS if name in sections]
+    entries_by_name = {}
+    uuids_to_remove = set()
+    cuts = []
+    for match in chain.from_iterable(SOURCES_LINE.finditer(content, *span) for span in spans):
+        uuid = match.group('uuid')
+        if match.group('decl'):
+            filename = get_filename(match.group('filename'))
+            entries_by_name[filename] = entries_by_name.get(filename, 0) + 1
+            if entries_by_name[filename] > 1:
+                uuids_to_remove.add(uuid)  # Keep first, remove rest
+                cuts.append((*match.span(), ''))
+        elif uuid in uuids_to_remove:
+            cuts.append((*match.span(), ''))
     
     # Find duplicates (files with more than one build file entry)
-    duplicates = {k: v for k, v in build_files_by_name.items() if len(v) > 1}
+    duplicates = {k: v for k, v in entries_by_name.items() if v > 1}
     
     if not duplicates:
         print("No duplicate build files found")
+        mark_processed(PROJECT_FILE, 'aggressive-dedup')
         return
     
     print(f"Found {len(duplicates)} files with duplicate entries:")
+    for filename, count in duplicates.items():
+        print(f"  {filename}: {count} entries -> keeping 1")
     
-    # For each duplicate, keep the first UUID and remove references to the others
-    uuids_to_remove = set()
-    for filename, uuids in duplicates.items():
-        print(f"  {filename}: {len(uuids)} entries -> keeping 1")
-        uuids_to_remove.update(uuids[1:])  # Keep first, remove rest
-    
-    # Remove the duplicate build file declarations
-    lines = content.split('\n')
-    new_lines = []
-    removed = 0
-    
-    for line in lines:
-        # Check if this line contains a UUID to remove
-        should_remove = False
-        for uuid in uuids_to_remove:
-            if uuid in line and 'in Sources' in line:
-                should_remove = True
-                break
-        
-        if should_remove:
-            removed += 1
-        else:
-            new_lines.append(line)
-    
-    new_content = '\n'.join(new_lines)
+    # Remove the duplicate build file declarations and their build phase entries
+    removed = len(cuts)
     
     if removed > 0:
-        with open(PROJECT_FILE, 'w') as f:
-            f.write(new_content)
+        write_project(PROJECT_FILE, edit_pieces(content, cuts))
+        mark_processed(PROJECT_FILE, 'aggressive-dedup')
         print(f"✅ Removed {removed} duplicate build file entries")
     else:
         print("No entries removed")
@@ -2,60 +2,192 @@
 """
 Clean Localizable.xcstrings by removing keys that are not referenced in source code.
 Keeps only keys that appear as a substring in any .swift or .plist file under NaarsCars.
+Files are scanned one at a time; with pyahocorasick installed all keys are matched in a
+single pass per file. The catalog is written back in the layout Xcode itself uses, so a
+clean only changes the lines of the keys it removes.
 """
 import json
 import os
+import shutil
+import tempfile
+from json.encoder import encode_basestring
 from pathlib import Path
 
+try:
+    import ahocorasick  # pip install pyahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # pip install orjson
+except ImportError:
+    orjson = None
+
 REPO_ROOT = Path(__file__).resolve().parents[1]
 CATALOG_PATH = REPO_ROOT / "Resources" / "Localizable.xcstrings"
 SOURCE_DIR = REPO_ROOT  # NaarsCars folder
+SOURCE_EXTENSIONS = (".swift", ".plist")
+# Build output, dependencies and VCS metadata: never walked
+SKIP_DIRS = {".build", ".git", "Pods", "DerivedData", "build", ".swiftpm"}
+# Top-level folders holding most user-facing strings: walked first
+PRIORITY_DIRS = ("Features", "UI")
+# The catalog writer emits many small chunks; buffer them into few large writes
+WRITE_BUFFER_SIZE = 1 << 20
+# Deepest nesting the catalog writer supports
+MAX_DEPTH = 64
+
+def build_key_matcher(keys):
+    """Return a function mapping source text to the indices in keys of the keys that occur in it.
+
+    Uses one Aho-Corasick automaton over all keys when pyahocorasick is
+    installed; otherwise falls back to a substring test per key, skipping
+    keys an earlier call already reported. The empty key is never reported.
+    """
+    pending = {i: key for i, key in enumerate(keys) if key}
+    if ahocorasick is None:
+        def match_pending(text):
+            hits = [i for i, key in pending.items() if key in text]
+            for i in hits:
+                del pending[i]
+            return hits
+        return match_pending
+    automaton = ahocorasick.Automaton()
+    for i, key in pending.items():
+        automaton.add_word(key, i)
+    automaton.make_automaton()
+    return lambda text: [i for _, i in automaton.iter(text)]
+
+def find_source_files(root):
+    """Yield Swift and plist files under root, pruning SKIP_DIRS during the walk.
+
+    PRIORITY_DIRS are visited first so a scan that stops early has seen the likeliest files.
+    """
+    top = os.fspath(root)
+    for dirpath, dirnames, filenames in os.walk(top):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        if dirpath == top:
+            dirnames.sort(key=lambda d: d not in PRIORITY_DIRS)
+        for name in filenames:
+            if name.endswith(SOURCE_EXTENSIONS):
+                yield Path(dirpath, name)
+
+def load_catalog(path):
+    """Load the catalog JSON, with orjson when it is installed"""
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+# Per-depth layout constants for the catalog writer: a newline plus the depth's indent,
+# and the prefixes that open a container or continue it. String catalogs nest under ten deep.
+_NEWLINES = tuple(b"\n" + b"  " * depth for depth in range(MAX_DEPTH + 1))
+_OPEN_OBJECT = tuple(b"{" + newline for newline in _NEWLINES[1:])
+_OPEN_ARRAY = tuple(b"[" + newline for newline in _NEWLINES[1:])
+_NEXT_ENTRY = tuple(b"," + newline for newline in _NEWLINES[1:])
+
+def _encode_scalar(value):
+    """Return the UTF-8 JSON bytes for a string, number, bool or null; orjson encodes straight to bytes"""
+    if orjson:
+        return orjson.dumps(value)
+    if isinstance(value, str):
+        return encode_basestring(value).encode("utf-8")
+    return json.dumps(value).encode("utf-8")
+
+def _write_json(out, value, depth):
+    """Write value as UTF-8 bytes in Xcode's xcstrings layout.
+
+    That is 2-space indents, " : " between key and value, and empty
+    containers split over a blank line; neither json nor orjson can emit it.
+    """
+    if isinstance(value, dict):
+        if not value:
+            out.write(b"{\n" + _NEWLINES[depth] + b"}")
+            return
+        # Every entry after the first shares one prefix, taken from the depth's constants
+        prefix = _OPEN_OBJECT[depth]
+        next_prefix = _NEXT_ENTRY[depth]
+        for key, item in value.items():
+            out.write(prefix + _encode_scalar(key) + b" : ")
+            _write_json(out, item, depth + 1)
+            prefix = next_prefix
+        out.write(_NEWLINES[depth] + b"}")
+    elif isinstance(value, list):
+        if not value:
+            out.write(b"[\n" + _NEWLINES[depth] + b"]")
+            return
+        prefix = _OPEN_ARRAY[depth]
+        next_prefix = _NEXT_ENTRY[depth]
+        for item in value:
+            out.write(prefix)
+            _write_json(out, item, depth + 1)
+            prefix = next_prefix
+        out.write(_NEWLINES[depth] + b"]")
+    else:
+        out.write(_encode_scalar(value))
+
+def dump_catalog(path, data):
+    """Write the catalog in Xcode's own layout, streamed through a large write buffer.
+
+    The stream goes to a temp file next to path that then atomically replaces
+    it, so a write that fails part-way never leaves a truncated catalog.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with open(fd, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            _write_json(f, data, 0)
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 def main():
     print("Loading catalog...")
-    with open(CATALOG_PATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_catalog(CATALOG_PATH)
 
     strings = data.get("strings", {})
     total_keys = len(strings)
     print(f"Total keys in catalog: {total_keys}")
 
-    # Collect all source file contents (Swift, plist); skip xcstrings and non-text
-    source_contents = []
-    for ext in ("*.swift", "*.plist"):
-        for path in SOURCE_DIR.rglob(ext):
-            if "Localizable.xcstrings" in str(path) or ".build" in str(path):
-                continue
-            try:
-                with open(path, "r", encoding="utf-8", errors="replace") as f:
-                    source_contents.append(f.read())
-            except Exception as e:
-                print(f"  Skip {path}: {e}")
-
-    combined = "\n".join(source_contents)
-    print(f"Scanned {len(source_contents)} source files")
-
-    # Keep only keys that appear in source
-    kept = {}
-    removed = []
-    for key in strings:
-        if key in combined:
-            kept[key] = strings[key]
-        else:
-            removed.append(key)
-
-    data["strings"] = kept
-    print(f"Kept: {len(kept)}, Removed: {len(removed)}")
+    # Scan source files (Swift, plist) one at a time for keys; skip xcstrings and non-text.
+    # referenced runs parallel to keys: a 1 marks a key seen in source. The empty
+    # key is a substring of everything, so it is always referenced.
+    keys = list(strings)
+    referenced = bytearray(len(keys))
+    if "" in strings:
+        referenced[keys.index("")] = 1
+    match_keys = build_key_matcher(keys)
+    scanned = 0
+    for path in find_source_files(SOURCE_DIR):
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                text = f.read()
+        except Exception as e:
+            print(f"  Skip {path}: {e}")
+            continue
+        scanned += 1
+        for i in match_keys(text):
+            referenced[i] = 1
+        if 0 not in referenced:
+            break  # every key is referenced; the remaining files can't change the result
+
+    print(f"Scanned {scanned} source files")
+
+    # Keep only keys that appear in source; unreferenced ones are dropped in place
+    removed = [key for key, seen in zip(keys, referenced) if not seen]
+    for key in removed:
+        del strings[key]
+
+    print(f"Kept: {len(strings)}, Removed: {len(removed)}")
+    if not removed:
+        print("Nothing to remove; catalog left untouched.")
+        return
 
     # Backup then write
     backup = REPO_ROOT / "Resources" / "Localizable.xcstrings.backup"
     if not backup.exists():
         print(f"Creating backup: {backup}")
-        with open(CATALOG_PATH, "r", encoding="utf-8") as f:
-            backup.write_text(f.read(), encoding="utf-8")
+        shutil.copyfile(CATALOG_PATH, backup)
 
-    with open(CATALOG_PATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    dump_catalog(CATALOG_PATH, data)
 
     print("Done. Catalog written.")
     if removed and len(removed) <= 30:
@@ -2,48 +2,45 @@
 """Deep clean duplicate entries from Xcode project"""
 
 import re
-from collections import defaultdict
+
+from pbxproj_io import is_processed, mark_processed, read_project, write_project
+from pbxproj_parser import edit_pieces, find_sections
 
 PROJECT_FILE = "NaarsCars.xcodeproj/project.pbxproj"
 
+# A whole line (with its newline) that mentions "/* filename.swift in Sources */"
+SOURCES_LINE = re.compile(r'^[^\n]*?/\* (.+\.swift) in Sources \*/[^\n]*\n?', re.MULTILINE)
+
 def main():
-    with open(PROJECT_FILE, 'r') as f:
-        lines = f.readlines()
-    
-    # Track seen entries by filename for "in Sources" entries
-    seen_sources = set()
-    new_lines = []
-    removed_count = 0
+    if is_processed(PROJECT_FILE, 'deep-clean'):
+        print("No line-level duplicates found (project unchanged since last run)")
+        return
     
-    # Track which file references we've seen in the files = ( ) arrays
-    in_files_array = False
-    current_files = []
-    files_start_line = -1
+    content = read_project(PROJECT_FILE)
     
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        
-        # Check if this is a duplicate "in Sources" build file entry
-        source_match = re.search(r'/\* (.+\.swift) in Sources \*/', line)
-        if source_match and 'PBXBuildFile' not in line:
-            filename = source_match.group(1)
+    # Only lines mentioning a Swift file "in Sources" can be duplicates, and only the
+    # build phase files lists hold them; keep the first line per filename
+    seen_sources = set()
+    cuts = []
+    span = find_sections(content).get('PBXSourcesBuildPhase')
+    if span and '.swift in Sources */' in content:
+        for match in SOURCES_LINE.finditer(content, *span):
+            if 'PBXBuildFile' in match.group(0):
+                continue
+            filename = match.group(1)
             if filename in seen_sources:
                 # Skip this duplicate line
-                removed_count += 1
-                i += 1
-                continue
-            seen_sources.add(filename)
-        
-        new_lines.append(line)
-        i += 1
+                cuts.append((match.start(), match.end(), ''))
+            else:
+                seen_sources.add(filename)
+    removed_count = len(cuts)
     
     if removed_count > 0:
-        with open(PROJECT_FILE, 'w') as f:
-            f.writelines(new_lines)
+        write_project(PROJECT_FILE, edit_pieces(content, cuts))
         print(f"✅ Removed {removed_count} duplicate source references")
     else:
         print("No line-level duplicates found")
+    mark_processed(PROJECT_FILE, 'deep-clean')
 
 if __name__ == "__main__":
     main()
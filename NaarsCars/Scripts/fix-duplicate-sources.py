@@ -3,59 +3,82 @@
 
 import re
 
+from pbxproj_io import is_processed, mark_processed, read_project, write_project
+from pbxproj_parser import edit_pieces, find_sections
+
 PROJECT_FILE = "NaarsCars.xcodeproj/project.pbxproj"
 
+SOURCES_HEADER = '/* Sources */ = {'
+FILES_OPEN = 'files = ('
+# A phase's files list closes on its own line at the object's indent. A bare ')' is no
+# terminator: entries such as "/* (null) in Sources */" contain one.
+FILES_CLOSE = '\n\t\t\t);'
+
+# One "UUID /* filename.swift in Sources */," line of a files list, with its indent and newline
+SOURCE_ENTRY = re.compile(r'^[ \t]*[A-F0-9]{24} /\* (.+\.swift) in Sources \*/,?[ \t]*\n?', re.MULTILINE)
+
+def sources_file_lists(content, pos, endpos):
+    """Yield the (start, end) offsets of the files list of each Sources build phase
+    between pos and endpos.
+
+    Anchored on the phase header with str.find and sliced up to the line closing
+    the list, so no regex has to scan or backtrack over the list. The range ends
+    just past the last entry's newline.
+    """
+    while True:
+        header = content.find(SOURCES_HEADER, pos, endpos)
+        if header < 0:
+            return
+        pos = header + len(SOURCES_HEADER)
+        files = content.find(FILES_OPEN, pos, endpos)
+        if files < 0:
+            return
+        # The files list must belong to this object, not a later one
+        if content.find('}', pos, files) >= 0:
+            continue
+        start = files + len(FILES_OPEN)
+        close = content.find(FILES_CLOSE, start, endpos)
+        if close < 0:
+            return
+        yield start, close + 1
+        pos = close + len(FILES_CLOSE)
+
 def main():
-    with open(PROJECT_FILE, 'r') as f:
-        content = f.read()
+    if is_processed(PROJECT_FILE, 'fix-duplicate-sources'):
+        print("No duplicates found in Sources build phases (project unchanged since last run)")
+        return
     
-    # Find the PBXSourcesBuildPhase section and remove duplicate entries
-    # Each entry looks like: UUID /* filename.swift in Sources */ = {isa = PBXBuildFile; ...
-    
-    # First, find all "in Sources" build file entries
-    build_file_pattern = r'(\s+[A-F0-9]{24} /\* .+\.swift in Sources \*/ = \{isa = PBXBuildFile;[^}]+\};)'
+    content = read_project(PROJECT_FILE)
     
-    # Find all source file references in the files array of PBXSourcesBuildPhase
-    sources_section_pattern = r'(/\* Sources \*/ = \{[^}]*files = \()([^)]+)(\);)'
+    # Find the PBXSourcesBuildPhase section and remove duplicate entries
     
-    def dedupe_sources_section(match):
-        prefix = match.group(1)
-        files_content = match.group(2)
-        suffix = match.group(3)
-        
-        # Split into individual file references
-        file_refs = [f.strip() for f in files_content.split(',') if f.strip()]
-        
-        # Extract unique file names and keep only first occurrence
-        seen_files = {}
-        unique_refs = []
-        
-        for ref in file_refs:
-            # Extract filename from comment like "UUID /* filename.swift in Sources */"
-            name_match = re.search(r'/\* (.+\.swift) in Sources \*/', ref)
-            if name_match:
-                filename = name_match.group(1)
-                if filename not in seen_files:
-                    seen_files[filename] = True
-                    unique_refs.append(ref)
+    # Keep the first entry per filename in each Sources build phase; later ones are
+    # cut out of the list by offset, leaving every other line of the list as it was.
+    # The cuts from all phases are applied to the file in one pass.
+    cuts = []
+    # The app and test targets' Sources phases both live in the PBXSourcesBuildPhase
+    # section, so one located region covers both
+    span = find_sections(content).get('PBXSourcesBuildPhase')
+    file_lists = sources_file_lists(content, *span) if span else ()
+    for start, end in file_lists:
+        seen_files = set()
+        removed = 0
+        for entry in SOURCE_ENTRY.finditer(content, start, end):
+            filename = entry.group(1)
+            if filename in seen_files:
+                cuts.append((entry.start(), entry.end(), ''))
+                removed += 1
             else:
-                unique_refs.append(ref)
-        
-        removed = len(file_refs) - len(unique_refs)
-        if removed > 0:
+                seen_files.add(filename)
+        if removed:
             print(f"  Removed {removed} duplicate entries from Sources build phase")
-        
-        return prefix + '\n\t\t\t\t' + ',\n\t\t\t\t'.join(unique_refs) + ',\n\t\t\t' + suffix
-    
-    # Process all Sources build phases
-    new_content = re.sub(sources_section_pattern, dedupe_sources_section, content, flags=re.DOTALL)
     
-    if new_content != content:
-        with open(PROJECT_FILE, 'w') as f:
-            f.write(new_content)
+    if cuts:
+        write_project(PROJECT_FILE, edit_pieces(content, cuts))
         print("✅ Removed duplicate source file entries from project")
     else:
         print("No duplicates found in Sources build phases")
+    mark_processed(PROJECT_FILE, 'fix-duplicate-sources')
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,99 @@
+"""
+Read and write project.pbxproj for the Xcode helper scripts.
+Reads are a single sized read into a preallocated buffer. Writes are one
+os.write of the encoded text to a temporary file in the same directory that
+atomically replaces the project.
+A script can record the hash of the project it left behind in a marker file and
+skip its work when run again on the same bytes.
+"""
+
+import hashlib
+import mmap
+import os
+import shutil
+import tempfile
+
+# Buffer for streamed writes: larger than any project, so pieces leave in one write
+WRITE_BUFFER_SIZE = 1 << 20
+
+def read_project(path):
+    """Read the project file into one buffer sized from its stat and decode it"""
+    with open(path, 'rb', buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        buf = bytearray(size)
+        view = memoryview(buf)
+        read = 0
+        while read < size:
+            count = f.readinto(view[read:])
+            if not count:
+                break
+            read += count
+        return str(view[:read], 'utf-8')
+
+def _write_all(fd, data):
+    """Write data to fd with os.write, looping only on short writes"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+def write_project(path, content):
+    """Write content to a temp file next to path, then atomically replace path.
+
+    content is the project text, or an iterable of text pieces that are encoded
+    and written through one large buffer as they come, so an edited project
+    never has to be joined into a single string.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.project.pbxproj.')
+    try:
+        if isinstance(content, str):
+            try:
+                _write_all(fd, content.encode('utf-8'))
+            finally:
+                os.close(fd)
+        else:
+            with open(fd, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                for piece in content:
+                    f.write(piece.encode('utf-8'))
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def mentions_all(path, needles):
+    """True if every bytes needle occurs in the file, searched through a read-only map"""
+    try:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return all(mm.find(needle) >= 0 for needle in needles)
+    except (OSError, ValueError):
+        return False
+
+def _marker_path(path, name):
+    return f'{path}.{name}.done'
+
+def _file_digest(path):
+    """SHA-256 of the file, hashed from the page cache through a read-only map
+    instead of copying the file in; an empty file can't be mapped (ValueError)"""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return hashlib.sha256(mm).hexdigest()
+
+def is_processed(path, name):
+    """True if path is byte-for-byte the project the `name` step last recorded"""
+    try:
+        with open(_marker_path(path, name), 'r') as f:
+            recorded = f.read().strip()
+        return recorded == _file_digest(path)
+    except (OSError, ValueError):
+        # No marker, or an empty project, which was never processed
+        return False
+
+def mark_processed(path, name):
+    """Record the project the `name` step left in path"""
+    try:
+        digest = _file_digest(path)
+        with open(_marker_path(path, name), 'w') as f:
+            f.write(digest + '\n')
+    except (OSError, ValueError):
+        pass
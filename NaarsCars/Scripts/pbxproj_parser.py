@@ -0,0 +1,277 @@
+"""
+Single-pass project.pbxproj parser for the Xcode helper scripts.
+
+The project is tokenized once into an object index keyed by UUID. Edits are
+recorded as insertions at source offsets and applied in one serialization
+pass, so untouched text keeps Xcode's exact formatting.
+"""
+
+import hashlib
+import os
+import pickle
+import re
+from operator import itemgetter
+
+from pbxproj_io import read_project
+from pbxproj_regex import ALL_UUIDS
+
+# No DOTALL: block comments are matched as runs of non-'*' text and '*'s not
+# followed by '/', which spans lines without a lazy scan for the closing "*/"
+_TOKEN = re.compile(r'''
+    (?P<space>\s+)
+  | (?P<comment>/\*[^*]*\*+(?:[^/*][^*]*\*+)*/|//[^\n]*)
+  | (?P<string>"(?:[^"\\]|\\[\s\S])*")
+  | (?P<punct>[{}();=,])
+  | (?P<word>(?:[^\s{}();=,"/]|/(?![*/]))+)
+''', re.VERBOSE)
+
+# Parse results of each project loaded, keyed by file stat and content digest.
+# Every project has its own cache file, named after a hash of its absolute path.
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'naarscars-xcode')
+_CACHE_KEYS = frozenset(('digest', 'stat', 'parsed'))
+
+# A missing, truncated or foreign cache file is treated as a miss
+_CACHE_ERRORS = (OSError, pickle.UnpicklingError, EOFError, KeyError, AttributeError)
+
+# Indentation Xcode uses for items of a list inside an object
+LIST_ITEM_INDENT = '\t\t\t\t'
+
+
+class PBXDict(dict):
+    """Dictionary value; start/end are the offsets just inside its braces"""
+    start = end = 0
+
+
+class PBXList(list):
+    """List value; start/end are the offsets just inside its parentheses.
+
+    tail is the offset just past the last item (and its comma, if any).
+    """
+    start = end = tail = 0
+    trailing_comma = True
+    _members = None
+
+    def has(self, value):
+        """Set-backed membership test, kept current by add()"""
+        if self._members is None:
+            self._members = set(self)
+        return value in self._members
+
+    def add(self, value):
+        self.append(value)
+        if self._members is not None:
+            self._members.add(value)
+
+
+def tokenize(content):
+    """Yield (kind, text, start, end) for every token that is not whitespace or a comment.
+
+    kind is 'value' (bare word or quoted string) or the punctuation character
+    itself. Comments are matched only to be stepped over; their text is never
+    extracted.
+    """
+    pos = 0
+    for match in _TOKEN.finditer(content):
+        if match.start() != pos:
+            break
+        pos = match.end()
+        kind = match.lastgroup
+        if kind == 'space' or kind == 'comment':
+            continue
+        text = match.group()
+        kind = text if kind == 'punct' else 'value'
+        yield kind, text, match.start(), pos
+    if pos != len(content):
+        raise ValueError(f"Unexpected character in project file at offset {pos}")
+
+
+def find_sections(content):
+    """Map each section name to the (body start, body end) offsets between its markers.
+
+    A single left-to-right str.find sweep over the Begin/End comments.
+    """
+    sections = {}
+    pos = 0
+    while True:
+        begin = content.find('/* Begin ', pos)
+        if begin < 0:
+            break
+        name_end = content.find(' section */', begin)
+        if name_end < 0:
+            break
+        name = content[begin + len('/* Begin '):name_end]
+        body_start = name_end + len(' section */')
+        body_end = content.find(f'/* End {name} section */', body_start)
+        if body_end < 0:
+            break
+        sections[name] = (body_start, body_end)
+        pos = body_end
+    return sections
+
+
+def edit_pieces(content, edits):
+    """Yield the pieces of content with (start, end, text) replacements applied.
+
+    The spans must not overlap; edits starting at the same offset keep the
+    order they were recorded in. An empty text cuts the span out.
+    """
+    pos = 0
+    for start, end, text in sorted(edits, key=itemgetter(0)):
+        yield content[pos:start]
+        yield text
+        pos = end
+    yield content[pos:]
+
+
+def apply_edits(content, edits):
+    """Return content with (start, end, text) replacements applied in one pass"""
+    return ''.join(edit_pieces(content, edits))
+
+
+def apply_insertions(content, insertions):
+    """Return content with (offset, text) insertions applied in one pass"""
+    return apply_edits(content, ((offset, offset, text) for offset, text in insertions))
+
+
+def _expect(tokens, i, kind):
+    if tokens[i][0] != kind:
+        raise ValueError(f"Expected '{kind}' at offset {tokens[i][2]}, found {tokens[i][1]!r}")
+    return i + 1
+
+
+def _parse_value(tokens, i):
+    """Parse the value starting at tokens[i]; return (value, next index)"""
+    kind, text, start, end = tokens[i]
+    if kind == '{':
+        node = PBXDict()
+        node.start = end
+        i += 1
+        while tokens[i][0] != '}':
+            key = tokens[i][1]
+            i = _expect(tokens, i + 1, '=')
+            node[key], i = _parse_value(tokens, i)
+            i = _expect(tokens, i, ';')
+        node.end = tokens[i][2]
+        return node, i + 1
+    if kind == '(':
+        node = PBXList()
+        node.start = node.tail = end
+        i += 1
+        while tokens[i][0] != ')':
+            value, i = _parse_value(tokens, i)
+            node.append(value)
+            node.tail = tokens[i - 1][3]
+            node.trailing_comma = tokens[i][0] == ','
+            if node.trailing_comma:
+                node.tail = tokens[i][3]
+                i += 1
+        node.end = tokens[i][2]
+        return node, i + 1
+    if kind != 'value':
+        raise ValueError(f"Unexpected {text!r} at offset {start}")
+    return text, i + 1
+
+
+def parse(content):
+    """Parse project text into (root object tree, section offsets)"""
+    tokens = list(tokenize(content))
+    root, _ = _parse_value(tokens, 0)
+    return root, find_sections(content)
+
+
+def _content_digest(content):
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _stat_key(path):
+    """File identity, size and timestamps; ctime can't be set back by tools like touch"""
+    st = os.stat(path)
+    return (os.path.abspath(path), st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+
+
+def _cache_file(path):
+    key = hashlib.blake2b(os.path.abspath(path).encode('utf-8'), digest_size=8).hexdigest()
+    return os.path.join(CACHE_DIR, f'pbxproj-parse-{key}.pickle')
+
+
+def load_project(path):
+    """Read and parse a project file, reusing the cached parse if it is unchanged.
+
+    The cache is matched on the file's stat first, so an untouched project is not
+    even hashed; a project whose stat changed is matched on its content digest.
+    """
+    # Stat before reading: a change after this point gets a new key next time
+    stat_key = _stat_key(path)
+    content = read_project(path)
+    cache_file = _cache_file(path)
+    try:
+        with open(cache_file, 'rb') as f:
+            cached = pickle.load(f)
+    except _CACHE_ERRORS:
+        cached = None
+
+    digest = None
+    if isinstance(cached, dict) and cached.keys() >= _CACHE_KEYS:
+        if cached['stat'] == stat_key:
+            return PBXProject(content, cached['parsed'])
+        digest = _content_digest(content)
+        if cached['digest'] == digest:
+            return PBXProject(content, cached['parsed'])
+
+    if digest is None:
+        digest = _content_digest(content)
+    parsed = parse(content)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(cache_file, 'wb') as f:
+            pickle.dump({'digest': digest, 'stat': stat_key, 'parsed': parsed}, f,
+                        pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return PBXProject(content, parsed)
+
+
+class PBXProject:
+    """Parsed project.pbxproj with deferred, offset-based edits"""
+
+    def __init__(self, content, parsed=None):
+        self.content = content
+        self.root, self.sections = parsed if parsed is not None else parse(content)
+        self.objects = self.root.get('objects', PBXDict())
+        self._insertions = []
+        self._uuids = None
+
+    def has_uuid(self, uuid):
+        """True if the UUID appears anywhere in the project, including added objects.
+
+        The set is built with one sweep over the text on first use.
+        """
+        if self._uuids is None:
+            self._uuids = set(ALL_UUIDS.findall(self.content))
+        return uuid in self._uuids
+
+    def add_object(self, isa, object_id, line):
+        """Append an object line to its isa section unless the UUID already exists.
+
+        Returns True if the line was added.
+        """
+        if isa not in self.sections:
+            return False
+        entry = PBXDict(isa=isa)
+        if self.objects.setdefault(object_id, entry) is not entry:
+            return False
+        self._insertions.append((self.sections[isa][1], line))
+        if self._uuids is not None:
+            self._uuids.add(object_id)
+        return True
+
+    def append_to_list(self, values, item):
+        """Append an item such as 'UUID /* name */' to a parsed list"""
+        separator = '' if values.trailing_comma else ','
+        self._insertions.append((values.tail, f'{separator}\n{LIST_ITEM_INDENT}{item},'))
+        values.add(item.split(' ', 1)[0])
+        values.trailing_comma = True
+
+    def serialize(self):
+        """Return the project text with all recorded edits applied"""
+        return apply_insertions(self.content, self._insertions)
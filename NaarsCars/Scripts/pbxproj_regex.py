@@ -0,0 +1,33 @@
+"""
+Precompiled project.pbxproj patterns and object IDs shared by the Xcode helper scripts.
+Sections are located with str.find (pbxproj_parser.find_sections), and group
+children and build phase files lists by the brace offsets of their parsed objects,
+not regexes.
+
+Patterns are compiled with google-re2 (pip install google-re2) when it is
+installed, for linear-time matching over the whole project; otherwise the
+standard re module is used. Only search/findall/group/start/end are used, which
+both engines provide.
+"""
+
+import re
+
+try:
+    import re2 as _engine
+except ImportError:
+    _engine = re
+
+def _compile(pattern):
+    """Compile with the fastest available engine"""
+    return _engine.compile(pattern)
+
+# Any 24-character object UUID, wherever it appears
+ALL_UUIDS = _compile(r'\b[0-9A-F]{24}\b')
+
+# Build phase UUIDs of the app and unit test targets
+MAIN_SOURCES_PHASE_ID = 'ACDCBDC42F0B74F400956D1C'
+TEST_SOURCES_PHASE_ID = 'ACDCBDD12F0B74F700956D1C'
+
+# Group UUIDs used by the scripts
+APP_GROUP_ID = 'ACDCBDF22F0B779600956D1C'
+MODELS_GROUP_ID = 'ACDCBE012F0B784900956D1C'
@@ -0,0 +1,520 @@
+#!/usr/bin/env python3
+"""
+Edit NaarsCars.xcodeproj/project.pbxproj with one or more commands in a single run.
+The project is loaded and parsed once, every command edits the same parsed project,
+and the result is written back once.
+
+Usage (from the NaarsCars directory):
+    python3 Scripts/pbxproj_tool.py add-models add-navigation
+    python3 Scripts/pbxproj_tool.py list-missing
+
+The add-*-to-xcode.py, add-navigation-files.py and add-single-file.py scripts
+are thin wrappers around the matching command.
+"""
+
+import argparse
+import os
+import re
+import secrets
+from pathlib import Path
+
+from pbxproj_io import mentions_all, write_project
+from pbxproj_parser import load_project
+from pbxproj_regex import (
+    APP_GROUP_ID,
+    MAIN_SOURCES_PHASE_ID,
+    MODELS_GROUP_ID,
+    TEST_SOURCES_PHASE_ID,
+)
+
+BASE_PATH = Path(__file__).resolve().parent.parent
+PROJECT_FILE = BASE_PATH / "NaarsCars.xcodeproj" / "project.pbxproj"
+
+def generate_xcode_id():
+    """Generate a 24-character hex ID for Xcode"""
+    return secrets.token_hex(12).upper()
+
+FILE_REF_TEMPLATE = '\t\t%s /* %s */ = {isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = %s; sourceTree = "<group>"; };\n'
+BUILD_FILE_TEMPLATE = '\t\t%s /* %s in Sources */ = {isa = PBXBuildFile; fileRef = %s /* %s */; };\n'
+
+def file_ref_line(file_id, filename):
+    return FILE_REF_TEMPLATE % (file_id, filename, filename)
+
+def build_file_line(build_id, file_id, filename):
+    return BUILD_FILE_TEMPLATE % (build_id, filename, file_id, filename)
+
+def add_to_list(project, object_id, key, item_id, comment):
+    """Append 'item_id /* comment */' to a list of a project object unless it is already there"""
+    owner = project.objects.get(object_id)
+    if not owner or key not in owner:
+        return False
+    values = owner[key]
+    if values.has(item_id):
+        return False
+    project.append_to_list(values, f'{item_id} /* {comment} */')
+    return True
+
+def referenced_names(project, names):
+    """Return the file names the project already references by a "/* name */" comment.
+
+    Xcode also writes comments as the file's path ("/* UI/Components/name */").
+    All the names are looked up in one scan, with a single alternation of their
+    comments; a name only matches a whole path component, so Card.swift is not
+    found in "/* RideCard.swift */".
+    """
+    if not names:
+        return set()
+    pattern = re.compile(r'/\* (?:[^*\n]*/)?(' + '|'.join(map(re.escape, names)) + r') \*/')
+    return set(pattern.findall(project.content))
+
+def drop_referenced(project, files):
+    """Remove entries of a {filepath: ids} dict whose file the project already references.
+
+    Scripts that generate fresh IDs on every run would otherwise add a file a second
+    time when re-run after a partial success.
+    """
+    if not files:
+        return files
+    referenced = referenced_names(project, {os.path.basename(filepath) for filepath in files})
+    for filepath in list(files):
+        if os.path.basename(filepath) in referenced:
+            print(f"⚠️  {filepath} already in project")
+            del files[filepath]
+    return files
+
+def all_referenced(path, files):
+    """True if the project file at path already references every file of a {filepath: ids} dict.
+
+    A byte search of the mapped file, cheap enough to run before the project is loaded.
+    """
+    return mentions_all(path, [f'/* {os.path.basename(filepath)} */'.encode('utf-8') for filepath in files])
+
+def find_group(project, path, exclude=()):
+    """Return the ID of the first PBXGroup with this path, skipping excluded IDs"""
+    for object_id, obj in project.objects.items():
+        if obj.get('isa') == 'PBXGroup' and obj.get('path') == path and object_id not in exclude:
+            return object_id
+    return None
+
+def find_groups(project, paths):
+    """Return {path: ID of the first PBXGroup with that path} for several paths in one pass"""
+    wanted = set(paths)
+    found = {}
+    for object_id, obj in project.objects.items():
+        path = obj.get('path')
+        if path in wanted and path not in found and obj.get('isa') == 'PBXGroup':
+            found[path] = object_id
+            if len(found) == len(wanted):
+                break
+    return found
+
+
+# add-missing: files that exist on disk but aren't in the Xcode project
+MISSING_FILES = [
+    # App
+    'App/AppDelegate.swift',
+    
+    # Core Models
+    'Core/Models/RequestQA.swift',
+    
+    # Core Services
+    'Core/Services/ClaimService.swift',
+    'Core/Services/ConversationService.swift',
+    'Core/Services/FavorService.swift',
+    'Core/Services/MessageService.swift',
+    'Core/Services/NotificationService.swift',
+    'Core/Services/PushNotificationService.swift',
+    'Core/Services/RideService.swift',
+    
+    # Core Utilities
+    'Core/Utilities/Constants.swift',
+    'Core/Utilities/DeepLinkParser.swift',
+    'Core/Utilities/DeviceIdentifier.swift',
+    'Core/Utilities/Logger.swift',
+    
+    # Claiming
+    'Features/Claiming/ViewModels/ClaimViewModel.swift',
+    'Features/Claiming/Views/ClaimSheet.swift',
+    'Features/Claiming/Views/CompleteSheet.swift',
+    'Features/Claiming/Views/PhoneRequiredSheet.swift',
+    'Features/Claiming/Views/UnclaimSheet.swift',
+    
+    # Favors
+    'Features/Favors/ViewModels/CreateFavorViewModel.swift',
+    'Features/Favors/ViewModels/FavorDetailViewModel.swift',
+    'Features/Favors/ViewModels/FavorsDashboardViewModel.swift',
+    'Features/Favors/Views/CreateFavorView.swift',
+    'Features/Favors/Views/EditFavorView.swift',
+    'Features/Favors/Views/FavorDetailView.swift',
+    'Features/Favors/Views/FavorsDashboardView.swift',
+    
+    # Messaging
+    'Features/Messaging/ViewModels/ConversationDetailViewModel.swift',
+    'Features/Messaging/ViewModels/ConversationsListViewModel.swift',
+    'Features/Messaging/Views/ConversationDetailView.swift',
+    'Features/Messaging/Views/ConversationsListView.swift',
+    
+    # Rides
+    'Features/Rides/ViewModels/CreateRideViewModel.swift',
+    'Features/Rides/ViewModels/RideDetailViewModel.swift',
+    'Features/Rides/ViewModels/RidesDashboardViewModel.swift',
+    'Features/Rides/Views/CreateRideView.swift',
+    'Features/Rides/Views/EditRideView.swift',
+    'Features/Rides/Views/RideDetailView.swift',
+    'Features/Rides/Views/RidesDashboardView.swift',
+    
+    # Test Files
+    'NaarsCarsTests/Core/Services/ClaimServiceTests.swift',
+    'NaarsCarsTests/Core/Services/FavorServiceTests.swift',
+    'NaarsCarsTests/Core/Services/RideServiceTests.swift',
+    'NaarsCarsTests/Features/Claiming/ClaimViewModelTests.swift',
+    'NaarsCarsTests/Features/Favors/CreateFavorViewModelTests.swift',
+    'NaarsCarsTests/Features/Favors/FavorsDashboardViewModelTests.swift',
+    'NaarsCarsTests/Features/Rides/CreateRideViewModelTests.swift',
+    'NaarsCarsTests/Features/Rides/RideDetailViewModelTests.swift',
+    'NaarsCarsTests/Features/Rides/RidesDashboardViewModelTests.swift',
+    'NaarsCarsUITests/NaarsCarsUITests.swift',
+    'NaarsCarsUITests/NaarsCarsUITestsLaunchTests.swift',
+    
+    # UI Components
+    'UI/Components/Buttons/ClaimButton.swift',
+    'UI/Components/Cards/FavorCard.swift',
+    'UI/Components/Cards/RideCard.swift',
+    'UI/Components/Common/RequestQAView.swift',
+    'UI/Components/Feedback/SkeletonConversationRow.swift',
+    'UI/Components/Feedback/SkeletonFavorCard.swift',
+    'UI/Components/Feedback/SkeletonLeaderboardRow.swift',
+    'UI/Components/Feedback/SkeletonMessageRow.swift',
+    'UI/Components/Feedback/SkeletonRideCard.swift',
+    'UI/Components/Feedback/SkeletonView.swift',
+    'UI/Components/Messaging/MessageBubble.swift',
+    'UI/Components/Messaging/MessageInputBar.swift',
+    
+    # Scripts
+    'Scripts/obfuscate.swift',
+]
+
+
+def add_missing(project):
+    """Add all missing Phase 1 and Phase 2 files to the project"""
+    file_ids = {
+        filepath: (generate_xcode_id(), generate_xcode_id(), os.path.basename(filepath))
+        for filepath in MISSING_FILES
+    }
+
+    # Add PBXFileReference entries
+    for filepath, (file_id, build_id, filename) in file_ids.items():
+        project.add_object('PBXFileReference', file_id, file_ref_line(file_id, filename))
+
+    # Add PBXBuildFile entries
+    for filepath, (file_id, build_id, filename) in file_ids.items():
+        project.add_object('PBXBuildFile', build_id, build_file_line(build_id, file_id, filename))
+
+    # Add to the main target's Sources build phase, or the test target's for test files
+    for filepath, (file_id, build_id, filename) in file_ids.items():
+        is_test = 'Tests' in filepath or 'UITests' in filepath
+        phase_id = TEST_SOURCES_PHASE_ID if is_test else MAIN_SOURCES_PHASE_ID
+        add_to_list(project, phase_id, 'files', build_id, f'{filename} in Sources')
+
+    # Note: File groups are handled by PBXFileSystemSynchronizedRootGroup
+    # Files should be auto-discovered, but we're adding explicit references
+    # for files that aren't being picked up
+    print(f"✅ Added {len(MISSING_FILES)} missing files to Xcode project")
+    print("⚠️  Note: Since project uses file system sync, files should auto-discover.")
+    print("   If files still don't appear, open Xcode and refresh the project.")
+
+
+# add-models: model files with their (file_ref_id, build_file_id)
+MODEL_FILES = {
+    'Profile.swift': ('3E213562F51C49A48F8FFF22', '84D9FCFB10CF4588B6DBDE7B'),
+    'Ride.swift': ('2B634CBD0C4F4A449A464E94', 'E45167AB602B45E7B6D76981'),
+    'Favor.swift': ('EAA13F58C91D42D592759C0A', 'CCD8C9BD002E479487AEC882'),
+    'Message.swift': ('ACCB369A6355469493FD86E2', 'CEE4883F511E4863BD984568'),
+    'Conversation.swift': ('BD9C1B07712F4342B2190EC3', '4AEC6FC9813D460387D9E4C0'),
+    'AppNotification.swift': ('C1C3095B25134EB5AEC9473F', 'B29F4A793E8647D9911439DC'),
+    'InviteCode.swift': ('5AB659281CBB4F4F8D32CAA1', 'DBEB76AEBDE842259F2C55B0'),
+    'Review.swift': ('BC5778A5153E4104992A72BB', '789FE0C64BB34FBD80D8B882'),
+    'TownHallPost.swift': ('A5BD6728D2674DDB93C700C3', '1F9DB8AF994C4A7198BC39C7'),
+}
+
+# Model test files with their IDs
+MODEL_TEST_FILES = {
+    'ProfileTests.swift': ('137CEAA3220D4C2D9BE917E3', 'B3BDA45A8E05444CAB1EF3A8'),
+    'RideTests.swift': ('BB8F6F3E319E4B4FB1541AE0', 'DC8A8AB167BC402DB2FCC38F'),
+    'FavorTests.swift': ('4AD8D7D6054B4B559ED772AC', '28B926AB58164D40896CFF72'),
+}
+
+# The IDs above are fixed, so every object line add-models writes is built once here:
+# all file references, then all build files
+MODEL_OBJECT_LINES = [
+    ('PBXFileReference', file_id, file_ref_line(file_id, filename))
+    for filename, (file_id, build_id) in {**MODEL_FILES, **MODEL_TEST_FILES}.items()
+] + [
+    ('PBXBuildFile', build_id, build_file_line(build_id, file_id, filename))
+    for filename, (file_id, build_id) in {**MODEL_FILES, **MODEL_TEST_FILES}.items()
+]
+
+
+def add_models(project):
+    """Add model files and their tests to the project"""
+    # Add file references and build files
+    for isa, object_id, line in MODEL_OBJECT_LINES:
+        project.add_object(isa, object_id, line)
+
+    # Add models to the Models group and the Sources build phase
+    for filename, (file_id, build_id) in MODEL_FILES.items():
+        add_to_list(project, MODELS_GROUP_ID, 'children', file_id, filename)
+    for filename, (file_id, build_id) in MODEL_FILES.items():
+        add_to_list(project, MAIN_SOURCES_PHASE_ID, 'files', build_id, f'{filename} in Sources')
+
+    # Add tests to the test Sources build phase
+    for filename, (file_id, build_id) in MODEL_TEST_FILES.items():
+        add_to_list(project, TEST_SOURCES_PHASE_ID, 'files', build_id, f'{filename} in Sources')
+
+    # Add tests to the test target's Models group, if it exists
+    test_models_group_id = find_group(project, 'Models', exclude={MODELS_GROUP_ID})
+    if test_models_group_id:
+        for filename, (file_id, build_id) in MODEL_TEST_FILES.items():
+            add_to_list(project, test_models_group_id, 'children', file_id, filename)
+
+    print("✅ Added all model files to Xcode project")
+
+
+# add-navigation: files to add with their desired IDs (using pattern from existing files)
+NAVIGATION_FILES = {
+    # Navigation files
+    'App/MainTabView.swift': ('ACDCBDD12F0B74F600956D1C', 'ACDCBDD32F0B74F600956D1C'),
+    'Features/Authentication/Views/PendingApprovalView.swift': ('ACDCBDD42F0B74F700956D1C', 'ACDCBDD52F0B74F700956D1C'),
+    'Features/Rides/Views/DashboardView.swift': ('ACDCBDD62F0B74F800956D1C', 'ACDCBDD62F0B74F810956D1C'),
+    'Features/Messaging/Views/MessagesListView.swift': ('ACDCBDD72F0B74F900956D1C', 'ACDCBDD72F0B74F910956D1C'),
+    'Features/Notifications/Views/NotificationsListView.swift': ('ACDCBDD82F0B74FA00956D1C', 'ACDCBDD82F0B74FA10956D1C'),
+    'Features/Leaderboards/Views/LeaderboardView.swift': ('ACDCBDD92F0B74FB00956D1C', 'ACDCBDD92F0B74FB10956D1C'),
+    'Features/Profile/Views/ProfileView.swift': ('ACDCBDDA2F0B74FC00956D1C', 'ACDCBDDA2F0B74FC10956D1C'),
+    # UI Components
+    'UI/Styles/ColorTheme.swift': ('ACDCBE2A2F0B7DB100956D1C', 'ACDCBE2B2F0B7DB100956D1C'),
+    'UI/Styles/Typography.swift': ('ACDCBE2C2F0B7DB200956D1C', 'ACDCBE2D2F0B7DB200956D1C'),
+    'UI/Components/Buttons/PrimaryButton.swift': ('ACDCBE2E2F0B7DB300956D1C', 'ACDCBE2F2F0B7DB300956D1C'),
+    'UI/Components/Buttons/SecondaryButton.swift': ('ACDCBE302F0B7DB400956D1C', 'ACDCBE312F0B7DB400956D1C'),
+    'UI/Components/Feedback/LoadingView.swift': ('ACDCBE322F0B7DB500956D1C', 'ACDCBE332F0B7DB500956D1C'),
+    'UI/Components/Feedback/ErrorView.swift': ('ACDCBE342F0B7DB600956D1C', 'ACDCBE352F0B7DB600956D1C'),
+    'UI/Components/Feedback/EmptyStateView.swift': ('ACDCBE362F0B7DB700956D1C', 'ACDCBE372F0B7DB700956D1C'),
+    'UI/Components/Common/AvatarView.swift': ('ACDCBE382F0B7DB800956D1C', 'ACDCBE392F0B7DB800956D1C'),
+    'UI/Components/Cards/RideCard.swift': ('ACDCBE3A2F0B7DB900956D1C', 'ACDCBE3B2F0B7DB900956D1C'),
+    'UI/Components/Cards/FavorCard.swift': ('ACDCBE3C2F0B7DBA00956D1C', 'ACDCBE3D2F0B7DBA00956D1C'),
+    # Utilities
+    'Core/Utilities/Constants.swift': ('ACDCBE3E2F0B7DBB00956D1C', 'ACDCBE3F2F0B7DBB00956D1C'),
+    'Core/Utilities/Logger.swift': ('ACDCBE402F0B7DBC00956D1C', 'ACDCBE412F0B7DBC00956D1C'),
+    'Core/Extensions/Date+Extensions.swift': ('ACDCBE422F0B7DBD00956D1C', 'ACDCBE432F0B7DBD00956D1C'),
+    'Core/Extensions/View+Extensions.swift': ('ACDCBE442F0B7DBE00956D1C', 'ACDCBE452F0B7DBE00956D1C'),
+}
+
+
+def add_navigation(project):
+    """Add navigation and UI component files to the project"""
+    for filepath, (file_id, build_id) in NAVIGATION_FILES.items():
+        if project.has_uuid(file_id):
+            print(f"⚠️  {filepath} already in project")
+            continue
+
+        filename = filepath.split('/')[-1]
+        project.add_object('PBXFileReference', file_id, file_ref_line(file_id, filename))
+        project.add_object('PBXBuildFile', build_id, build_file_line(build_id, file_id, filename))
+        if 'App/' in filepath:
+            add_to_list(project, APP_GROUP_ID, 'children', file_id, filename)
+        add_to_list(project, MAIN_SOURCES_PHASE_ID, 'files', build_id, f'{filename} in Sources')
+
+        print(f"✅ Added {filepath}")
+
+    print("✅ All files added to Xcode project")
+
+
+def add_files(project, entries):
+    """Add Swift files to a parsed project in one batch.
+
+    entries is an iterable of (filepath, group path) pairs; each file gets a file
+    reference in that group and a build file in the app target's Sources phase.
+    Files the project already references, and repeats of a name earlier in the
+    batch, are skipped. Returns the filepaths that were added.
+    """
+    entries = list(entries)
+    present = referenced_names(project, {os.path.basename(filepath) for filepath, _ in entries})
+    added = []
+    for filepath, group_path in entries:
+        filename = os.path.basename(filepath)
+        if filename in present:
+            print(f"⚠️  {filename} already in project")
+            continue
+        present.add(filename)
+
+        file_id = generate_xcode_id()
+        build_id = generate_xcode_id()
+        project.add_object('PBXFileReference', file_id, file_ref_line(file_id, filename))
+        project.add_object('PBXBuildFile', build_id, build_file_line(build_id, file_id, filename))
+        group_id = find_group(project, group_path)
+        if group_id:
+            add_to_list(project, group_id, 'children', file_id, filename)
+        add_to_list(project, MAIN_SOURCES_PHASE_ID, 'files', build_id, f'{filename} in Sources')
+        added.append(filepath)
+        print(f"✅ Added {filename} to project")
+    return added
+
+
+# add-single: (file path, group path) pairs
+SINGLE_FILES = [
+    ('UI/Components/Map/AddressText.swift', 'Map'),
+]
+
+
+def add_single(project):
+    """Add the files listed in SINGLE_FILES to their groups and the app target"""
+    add_files(project, SINGLE_FILES)
+
+
+# Directories never walked: Scripts is not part of the app target, the rest are tooling output
+SKIP_DIRS = {"Scripts", ".git", "build"}
+
+def find_all_swift_files(base_path):
+    """Yield the path of every Swift file in the project directory, relative to it"""
+    stack = [str(base_path)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(".swift"):
+                    yield os.path.relpath(entry.path, base_path)
+
+# "UUID /* name.swift */ ... path = "..."" on one line: (UUID, name, quoted path)
+SWIFT_FILE_REF = re.compile(r'(\w+)\s*/\*\s*([^*]+\.swift)\s*\*/.*?path\s*=\s*"([^"]+)"')
+
+# Fixed text every quoted path starts with, as Xcode writes it
+QUOTED_PATH = 'path = "'
+
+def _quoted_path_lines(content):
+    """Yield the (start, end) offsets of each line holding a quoted path"""
+    pos = 0
+    while True:
+        hit = content.find(QUOTED_PATH, pos)
+        if hit < 0:
+            return
+        start = content.rfind('\n', 0, hit) + 1
+        end = content.find('\n', hit)
+        if end < 0:
+            end = len(content)
+        yield start, end
+        pos = end
+
+def parse_existing_files(project_content):
+    """Parse existing file references from project.pbxproj"""
+    existing_files = set()
+    
+    # Find all file references. Only the few lines with a quoted path can match, so
+    # they are found with str.find and the pattern runs on those lines alone
+    # instead of being tried at every word of the project.
+    matches = [
+        match
+        for start, end in _quoted_path_lines(project_content)
+        for match in SWIFT_FILE_REF.findall(project_content, start, end)
+    ]
+    existing_files.update(path for _, _, path in matches)
+    
+    return existing_files
+
+
+def list_missing(project):
+    """Report Swift files on disk that aren't in the project and write MISSING-FILES-REPORT.txt"""
+    base_path = BASE_PATH
+    print("=" * 80)
+    print("ADDING FILES TO XCODE PROJECT")
+    print("=" * 80)
+
+    # Parse existing files
+    existing_files = parse_existing_files(project.content)
+    existing_names = {os.path.basename(f) for f in existing_files}
+
+    # Walk the Swift files once, keeping only those missing from the project
+    # (checked by filename)
+    swift_count = 0
+    missing_files = []
+    for file_path in find_all_swift_files(base_path):
+        swift_count += 1
+        if os.path.basename(file_path) not in existing_names:
+            missing_files.append(file_path)
+
+    print(f"\n📁 Found {swift_count} Swift files on disk")
+    # Also check PBXFileSystemSynchronizedRootGroup - if used, all files should be auto-discovered
+    if "PBXFileSystemSynchronizedRootGroup" in project.content:
+        print("⚠️  Project uses PBXFileSystemSynchronizedRootGroup")
+        print("   Files should auto-discover, but may need Xcode refresh")
+    print(f"📋 Found {len(existing_files)} files already in project")
+
+    print(f"\n❌ Missing from project: {len(missing_files)} files")
+
+    if not missing_files:
+        print("\n✅ All files are already in the project!")
+        print("\n💡 If files don't appear in Xcode:")
+        print("   1. Close and reopen Xcode")
+        print("   2. Clean build folder: Product → Clean Build Folder (⌘⇧K)")
+        print("   3. If using PBXFileSystemSynchronizedRootGroup, Xcode should auto-discover")
+        return
+
+    # Show missing files
+    missing_files.sort()
+    print("\n📝 Missing files:")
+    for file_path in missing_files[:20]:  # Show first 20
+        print(f"   • {file_path}")
+    if len(missing_files) > 20:
+        print(f"   ... and {len(missing_files) - 20} more")
+
+    print("\n⚠️  NOTE: This script identifies missing files.")
+    print("   To add them properly, use Xcode's 'Add Files' dialog:")
+    print("   1. Right-click 'NaarsCars' folder in Xcode")
+    print("   2. Select 'Add Files to NaarsCars...'")
+    print("   3. Select the missing folders/files")
+    print("   4. Check 'Create groups' and 'Add to targets'")
+    print("\n   OR manually add via drag-and-drop from Finder")
+
+    # Generate a report
+    report_file = base_path / "MISSING-FILES-REPORT.txt"
+    with open(report_file, 'w') as f:
+        f.write("MISSING FILES FROM XCODE PROJECT\n")
+        f.write("=" * 80 + "\n\n")
+        f.write(f"Total missing: {len(missing_files)}\n\n")
+        f.write("\n".join(missing_files))
+        f.write("\n")
+
+    print(f"\n📄 Report saved to: {report_file}")
+
+
+# Command name -> function that applies it to the parsed project
+COMMANDS = {
+    'add-missing': add_missing,
+    'add-models': add_models,
+    'add-navigation': add_navigation,
+    'add-single': add_single,
+    'list-missing': list_missing,
+}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('commands', nargs='+', choices=COMMANDS,
+                        help='commands to apply, in order, to one parsed project')
+    parser.add_argument('--project', default=str(PROJECT_FILE),
+                        help='path to project.pbxproj')
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.project):
+        print(f"❌ Project file not found: {args.project}")
+        return
+
+    project = load_project(args.project)
+    for name in args.commands:
+        COMMANDS[name](project)
+
+    content = project.serialize()
+    if content != project.content:
+        write_project(args.project, content)
+
+if __name__ == "__main__":
+    main()
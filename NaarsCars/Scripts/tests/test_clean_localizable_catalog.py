@@ -0,0 +1,93 @@
+"""
+Tests for clean_localizable_catalog.dump_catalog
+Run from the NaarsCars directory: python3 -m unittest discover Scripts/tests
+"""
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import clean_localizable_catalog
+from clean_localizable_catalog import CATALOG_PATH, dump_catalog, load_catalog
+
+# A small catalog as Xcode writes it: " : " separators, 2-space indents, empty
+# containers split over a blank line and no trailing newline
+CATALOG = (
+    '{\n'
+    '  "sourceLanguage" : "en",\n'
+    '  "strings" : {\n'
+    '    "" : {\n'
+    '\n'
+    '    },\n'
+    '    "%lld seat%@" : {\n'
+    '      "extractionState" : "manual",\n'
+    '      "localizations" : {\n'
+    '        "es" : {\n'
+    '          "stringUnit" : {\n'
+    '            "state" : "translated",\n'
+    '            "value" : "%lld asiento%@ — \\"libre\\""\n'
+    '          }\n'
+    '        }\n'
+    '      }\n'
+    '    },\n'
+    '    "Tab\\tand\\nnewline" : {\n'
+    '      "comments" : [\n'
+    '        "first",\n'
+    '        2,\n'
+    '        true,\n'
+    '        null\n'
+    '      ],\n'
+    '      "tags" : [\n'
+    '\n'
+    '      ]\n'
+    '    }\n'
+    '  },\n'
+    '  "version" : "1.0"\n'
+    '}'
+).encode('utf-8')
+
+
+class DumpCatalogTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = Path(self.tmp.name, 'Localizable.xcstrings')
+        self.path.write_bytes(CATALOG)
+
+    def round_trip(self):
+        dump_catalog(self.path, load_catalog(self.path))
+        return self.path.read_bytes()
+
+    def test_round_trip_keeps_xcode_layout(self):
+        self.assertEqual(self.round_trip(), CATALOG)
+
+    def test_round_trip_without_orjson(self):
+        with mock.patch.object(clean_localizable_catalog, 'orjson', None):
+            self.assertEqual(self.round_trip(), CATALOG)
+
+    def test_edited_catalog_loads_back_equal(self):
+        data = load_catalog(self.path)
+        del data['strings']['%lld seat%@']
+        data['strings']['Añadir'] = {}
+        dump_catalog(self.path, data)
+        self.assertEqual(load_catalog(self.path), data)
+
+    def test_failed_write_leaves_catalog_and_no_temp_file(self):
+        with self.assertRaises(TypeError):
+            dump_catalog(self.path, {'strings': {'bad': {1, 2}}})
+        self.assertEqual(self.path.read_bytes(), CATALOG)
+        self.assertEqual(os.listdir(self.tmp.name), [self.path.name])
+
+    @unittest.skipUnless(CATALOG_PATH.exists(), 'no Localizable.xcstrings in this checkout')
+    def test_project_catalog_round_trips_byte_for_byte(self):
+        self.path.write_bytes(CATALOG_PATH.read_bytes())
+        self.assertEqual(self.round_trip(), CATALOG_PATH.read_bytes())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Tests for fix-duplicate-sources.py
+Run from the NaarsCars directory: python3 -m unittest discover Scripts/tests
+"""
+import contextlib
+import importlib.util
+import io
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+_spec = importlib.util.spec_from_file_location(
+    'fix_duplicate_sources', SCRIPTS_DIR / 'fix-duplicate-sources.py')
+fix_duplicate_sources = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(fix_duplicate_sources)
+
+# Main target Sources phase with a "(null)" entry ahead of the duplicates, as in the
+# real project, followed by the test target's phase
+PROJECT = """\
+// !$*UTF8*$!
+{
+\tobjects = {
+
+/* Begin PBXSourcesBuildPhase section */
+\t\tACDCBDC42F0B74F400956D1C /* Sources */ = {
+\t\t\tisa = PBXSourcesBuildPhase;
+\t\t\tbuildActionMask = 2147483647;
+\t\t\tfiles = (
+\t\t\t\t000000000000000000000001 /* RideCard.swift in Sources */,
+\t\t\t\t71A12E51E0A743A3B7566460 /* (null) in Sources */,
+\t\t\t\t000000000000000000000002 /* FavorCard.swift in Sources */,
+\t\t\t\t000000000000000000000003 /* RideCard.swift in Sources */,
+\t\t\t\t000000000000000000000004 /* FavorCard.swift in Sources */,
+\t\t\t);
+\t\t\trunOnlyForDeploymentPostprocessing = 0;
+\t\t};
+\t\tACDCBDD12F0B74F700956D1C /* Sources */ = {
+\t\t\tisa = PBXSourcesBuildPhase;
+\t\t\tbuildActionMask = 2147483647;
+\t\t\tfiles = (
+\t\t\t\t000000000000000000000005 /* RideCardTests.swift in Sources */,
+\t\t\t\t000000000000000000000006 /* RideCardTests.swift in Sources */,
+\t\t\t);
+\t\t\trunOnlyForDeploymentPostprocessing = 0;
+\t\t};
+/* End PBXSourcesBuildPhase section */
+\t};
+}
+"""
+
+
+class FixDuplicateSourcesTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        project_dir = Path(self.tmp.name, 'NaarsCars.xcodeproj')
+        project_dir.mkdir()
+        self.project = project_dir / 'project.pbxproj'
+        self.project.write_text(PROJECT, encoding='utf-8')
+        cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        self.addCleanup(os.chdir, cwd)
+
+    def test_file_lists_end_at_closing_line_not_null_entry(self):
+        lists = list(fix_duplicate_sources.sources_file_lists(PROJECT, 0, len(PROJECT)))
+        self.assertEqual(len(lists), 2)
+        start, end = lists[0]
+        self.assertIn('(null) in Sources', PROJECT[start:end])
+        self.assertIn('000000000000000000000004 /* FavorCard.swift', PROJECT[start:end])
+
+    def test_removes_duplicates_after_null_entry(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            fix_duplicate_sources.main()
+        content = self.project.read_text(encoding='utf-8')
+        for kept in ('000000000000000000000001', '71A12E51E0A743A3B7566460',
+                     '000000000000000000000002', '000000000000000000000005'):
+            self.assertIn(kept, content)
+        for removed in ('000000000000000000000003', '000000000000000000000004',
+                        '000000000000000000000006'):
+            self.assertNotIn(removed, content)
+        self.assertIn(
+            '\t\t\t\t000000000000000000000002 /* FavorCard.swift in Sources */,\n\t\t\t);',
+            content)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+"""
+Tests for the pbxproj_io processed markers
+Run from the NaarsCars directory: python3 -m unittest discover Scripts/tests
+"""
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pbxproj_io import is_processed, mark_processed
+
+
+class ProcessedMarkerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.project = Path(self.tmp.name, 'project.pbxproj')
+        self.project.write_text('// !$*UTF8*$!\n{\n}\n', encoding='utf-8')
+
+    def test_unmarked_project_is_not_processed(self):
+        self.assertFalse(is_processed(self.project, 'phase2'))
+
+    def test_marked_project_is_processed(self):
+        mark_processed(self.project, 'phase2')
+        self.assertTrue(is_processed(self.project, 'phase2'))
+        self.assertTrue(Path(f'{self.project}.phase2.done').exists())
+
+    def test_changed_project_is_not_processed(self):
+        mark_processed(self.project, 'phase2')
+        with open(self.project, 'a', encoding='utf-8') as f:
+            f.write('\n')
+        self.assertFalse(is_processed(self.project, 'phase2'))
+
+    def test_markers_are_kept_per_step(self):
+        mark_processed(self.project, 'phase2')
+        self.assertFalse(is_processed(self.project, 'profile'))
+
+    def test_empty_or_missing_project_is_never_processed(self):
+        self.project.write_bytes(b'')
+        mark_processed(self.project, 'phase2')
+        self.assertFalse(is_processed(self.project, 'phase2'))
+        missing = Path(self.tmp.name, 'missing.pbxproj')
+        mark_processed(missing, 'phase2')
+        self.assertFalse(is_processed(missing, 'phase2'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+"""
+Tests for pbxproj_parser
+Run from the NaarsCars directory: python3 -m unittest discover Scripts/tests
+"""
+import os
+import pickle
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pbxproj_parser
+from pbxproj_parser import apply_insertions, find_sections, load_project, tokenize
+
+# One file reference in its section and a group listing it
+PROJECT = """\
+// !$*UTF8*$!
+{
+\tobjects = {
+
+/* Begin PBXFileReference section */
+\t\t000000000000000000000001 /* RideCard.swift */ = {isa = PBXFileReference; path = RideCard.swift; sourceTree = "<group>"; };
+/* End PBXFileReference section */
+
+/* Begin PBXGroup section */
+\t\t000000000000000000000021 /* Cards */ = {
+\t\t\tisa = PBXGroup;
+\t\t\tchildren = (
+\t\t\t\t000000000000000000000001 /* RideCard.swift */,
+\t\t\t);
+\t\t\tpath = Cards;
+\t\t};
+/* End PBXGroup section */
+\t};
+\trootObject = 000000000000000000000099 /* Project object */;
+}
+"""
+
+
+class TokenizeTests(unittest.TestCase):
+
+    def test_skips_whitespace_and_comments(self):
+        content = '{a = b; /* one * two */ c = (d, // line\n e);}'
+        self.assertEqual([text for _, text, _, _ in tokenize(content)],
+                         ['{', 'a', '=', 'b', ';', 'c', '=', '(', 'd', ',', 'e', ')', ';', '}'])
+
+    def test_kinds_and_offsets(self):
+        content = 'path = UI/Components/RideCard.swift;'
+        tokens = list(tokenize(content))
+        self.assertEqual([kind for kind, _, _, _ in tokens], ['value', '=', 'value', ';'])
+        for _, text, start, end in tokens:
+            self.assertEqual(content[start:end], text)
+
+    def test_quoted_string_with_escaped_quote_is_one_value(self):
+        content = 'name = "Say \\"hi\\" /* not a comment */";'
+        self.assertEqual(list(tokenize(content))[2][1], '"Say \\"hi\\" /* not a comment */"')
+
+    def test_unterminated_string_raises(self):
+        with self.assertRaises(ValueError):
+            list(tokenize('{name = "open;}'))
+
+    def test_parses_every_token_of_the_sample_project(self):
+        tokens = list(tokenize(PROJECT))
+        self.assertEqual(tokens[0][1], '{')
+        self.assertEqual(tokens[-1][1], '}')
+        self.assertNotIn('/* RideCard.swift */', [text for _, text, _, _ in tokens])
+
+
+class FindSectionsTests(unittest.TestCase):
+
+    def test_maps_each_section_to_its_body(self):
+        sections = find_sections(PROJECT)
+        self.assertEqual(list(sections), ['PBXFileReference', 'PBXGroup'])
+        start, end = sections['PBXFileReference']
+        body = PROJECT[start:end]
+        self.assertTrue(body.startswith('\n\t\t000000000000000000000001 /* RideCard.swift */'))
+        self.assertTrue(body.endswith('};\n'))
+        start, end = sections['PBXGroup']
+        self.assertEqual(PROJECT[end:].split('\n', 1)[0], '/* End PBXGroup section */')
+
+    def test_section_without_end_marker_is_left_out(self):
+        content = PROJECT.replace('/* End PBXGroup section */', '')
+        self.assertEqual(list(find_sections(content)), ['PBXFileReference'])
+
+    def test_no_sections(self):
+        self.assertEqual(find_sections('{\n\tobjects = {\n\t};\n}\n'), {})
+
+
+class ApplyInsertionsTests(unittest.TestCase):
+
+    def test_offsets_refer_to_the_original_text(self):
+        self.assertEqual(apply_insertions('abcdef', [(4, 'Y'), (1, 'X'), (6, 'Z')]), 'aXbcdYefZ')
+
+    def test_insertions_at_one_offset_keep_their_order(self):
+        self.assertEqual(apply_insertions('ab', [(1, '1'), (1, '2'), (0, '0'), (1, '3')]), '0a123b')
+
+    def test_no_insertions(self):
+        self.assertEqual(apply_insertions(PROJECT, []), PROJECT)
+
+    def test_line_inserted_at_section_end(self):
+        _, end = find_sections(PROJECT)['PBXFileReference']
+        line = '\t\t000000000000000000000002 /* FavorCard.swift */ = {isa = PBXFileReference; };\n'
+        content = apply_insertions(PROJECT, [(end, line)])
+        self.assertIn(line + '/* End PBXFileReference section */', content)
+        self.assertEqual(content.replace(line, ''), PROJECT)
+
+
+class LoadProjectCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cache_dir = Path(self.tmp.name, 'cache')
+        patcher = mock.patch.object(pbxproj_parser, 'CACHE_DIR', str(self.cache_dir))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        parse = mock.patch.object(pbxproj_parser, 'parse', wraps=pbxproj_parser.parse)
+        self.parse = parse.start()
+        self.addCleanup(parse.stop)
+        self.project = self.write_project('NaarsCars.xcodeproj', PROJECT)
+
+    def write_project(self, directory, content):
+        project_dir = Path(self.tmp.name, directory)
+        project_dir.mkdir(exist_ok=True)
+        path = project_dir / 'project.pbxproj'
+        path.write_text(content, encoding='utf-8')
+        return str(path)
+
+    def cache_files(self):
+        return sorted(self.cache_dir.iterdir()) if self.cache_dir.exists() else []
+
+    def test_miss_parses_and_writes_a_cache_file(self):
+        project = load_project(self.project)
+        self.assertEqual(self.parse.call_count, 1)
+        self.assertEqual(project.objects['000000000000000000000021']['path'], 'Cards')
+        self.assertEqual(len(self.cache_files()), 1)
+
+    def test_unchanged_project_is_not_parsed_again(self):
+        load_project(self.project)
+        project = load_project(self.project)
+        self.assertEqual(self.parse.call_count, 1)
+        self.assertEqual(project.sections, pbxproj_parser.find_sections(PROJECT))
+
+    def test_touched_project_with_same_content_hits_on_digest(self):
+        load_project(self.project)
+        st = os.stat(self.project)
+        os.utime(self.project, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        load_project(self.project)
+        self.assertEqual(self.parse.call_count, 1)
+
+    def test_edited_project_is_parsed_again(self):
+        load_project(self.project)
+        Path(self.project).write_text(PROJECT.replace('path = Cards;', 'path = Rows;'), encoding='utf-8')
+        project = load_project(self.project)
+        self.assertEqual(self.parse.call_count, 2)
+        self.assertEqual(project.objects['000000000000000000000021']['path'], 'Rows')
+
+    def test_each_project_keeps_its_own_cache_file(self):
+        other = self.write_project('Other.xcodeproj', PROJECT.replace('Cards', 'Rows'))
+        load_project(self.project)
+        load_project(other)
+        load_project(self.project)
+        load_project(other)
+        self.assertEqual(self.parse.call_count, 2)
+        self.assertEqual(len(self.cache_files()), 2)
+
+    def test_unreadable_or_foreign_cache_is_a_miss(self):
+        load_project(self.project)
+        cache_file, = self.cache_files()
+        for payload in (b'', b'not a pickle', pickle.dumps(['digest', 'stat', 'parsed']),
+                        pickle.dumps({'digest': None})):
+            cache_file.write_bytes(payload)
+            project = load_project(self.project)
+            self.assertEqual(project.objects['000000000000000000000021']['path'], 'Cards')
+        self.assertEqual(self.parse.call_count, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
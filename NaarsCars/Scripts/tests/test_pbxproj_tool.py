@@ -0,0 +1,93 @@
+"""
+Tests for pbxproj_tool.add_files
+Run from the NaarsCars directory: python3 -m unittest discover Scripts/tests
+"""
+import contextlib
+import io
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pbxproj_parser import PBXProject
+from pbxproj_tool import add_files
+
+# One existing file referenced by name and one by path, a Cards group and the
+# app target's Sources phase
+PROJECT = """\
+// !$*UTF8*$!
+{
+\tobjects = {
+
+/* Begin PBXBuildFile section */
+\t\t000000000000000000000011 /* RideCard.swift in Sources */ = {isa = PBXBuildFile; fileRef = 000000000000000000000001 /* RideCard.swift */; };
+\t\t000000000000000000000012 /* UI/Components/AddressText.swift in Sources */ = {isa = PBXBuildFile; fileRef = 000000000000000000000002 /* UI/Components/AddressText.swift */; };
+/* End PBXBuildFile section */
+
+/* Begin PBXFileReference section */
+\t\t000000000000000000000001 /* RideCard.swift */ = {isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = RideCard.swift; sourceTree = "<group>"; };
+\t\t000000000000000000000002 /* UI/Components/AddressText.swift */ = {isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = UI/Components/AddressText.swift; sourceTree = "<group>"; };
+/* End PBXFileReference section */
+
+/* Begin PBXGroup section */
+\t\t000000000000000000000021 /* Cards */ = {
+\t\t\tisa = PBXGroup;
+\t\t\tchildren = (
+\t\t\t\t000000000000000000000001 /* RideCard.swift */,
+\t\t\t);
+\t\t\tpath = Cards;
+\t\t\tsourceTree = "<group>";
+\t\t};
+/* End PBXGroup section */
+
+/* Begin PBXSourcesBuildPhase section */
+\t\tACDCBDC42F0B74F400956D1C /* Sources */ = {
+\t\t\tisa = PBXSourcesBuildPhase;
+\t\t\tbuildActionMask = 2147483647;
+\t\t\tfiles = (
+\t\t\t\t000000000000000000000011 /* RideCard.swift in Sources */,
+\t\t\t\t000000000000000000000012 /* UI/Components/AddressText.swift in Sources */,
+\t\t\t);
+\t\t\trunOnlyForDeploymentPostprocessing = 0;
+\t\t};
+/* End PBXSourcesBuildPhase section */
+\t};
+\trootObject = 000000000000000000000099 /* Project object */;
+}
+"""
+
+
+class AddFilesTests(unittest.TestCase):
+
+    def add(self, entries):
+        project = PBXProject(PROJECT)
+        with contextlib.redirect_stdout(io.StringIO()):
+            added = add_files(project, entries)
+        return added, project.serialize()
+
+    def test_name_that_is_a_suffix_of_an_existing_file_is_added(self):
+        added, content = self.add([('UI/Components/Cards/Card.swift', 'Cards')])
+        self.assertEqual(added, ['UI/Components/Cards/Card.swift'])
+        self.assertEqual(content.count('/* Card.swift in Sources */'), 2)
+        self.assertEqual(content.count('/* Card.swift */'), 3)
+
+    def test_existing_files_are_skipped(self):
+        added, content = self.add([
+            ('UI/Components/Cards/RideCard.swift', 'Cards'),
+            ('UI/Components/AddressText.swift', 'Components'),
+        ])
+        self.assertEqual(added, [])
+        self.assertEqual(content, PROJECT)
+
+    def test_repeated_name_in_batch_is_added_once(self):
+        added, content = self.add([
+            ('UI/Components/Cards/Card.swift', 'Cards'),
+            ('UI/Components/Cards/Card.swift', 'Cards'),
+        ])
+        self.assertEqual(added, ['UI/Components/Cards/Card.swift'])
+        self.assertEqual(content.count('isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = Card.swift;'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()